@@ -28,32 +28,31 @@ use crate::{
 /// so that the original Python type can be reconstructed on output (enabling `isinstance()`).
 /// This applies recursively to nested dataclasses in fields, lists, dicts, etc.
 ///
+/// Exact instances of the common builtin types are dispatched first via `py_to_monty_exact`,
+/// which avoids the subclass checks (and the namedtuple `_fields` probe for tuples) that the
+/// general path needs.
+///
 /// # Important
 /// Checks `bool` before `int` since `bool` is a subclass of `int` in Python.
 pub fn py_to_monty(obj: &Bound<'_, PyAny>, dc_registry: &DcRegistry) -> PyResult<MontyObject> {
+    if let Some(result) = py_to_monty_exact(obj, dc_registry) {
+        return result;
+    }
     if obj.is_none() {
         Ok(MontyObject::None)
     } else if let Ok(bool) = obj.cast::<PyBool>() {
         // Check bool BEFORE int since bool is a subclass of int in Python
         Ok(MontyObject::Bool(bool.is_true()))
     } else if let Ok(int) = obj.cast::<PyInt>() {
-        // Try i64 first (fast path), fall back to BigInt for large values
-        if let Ok(i) = int.extract::<i64>() {
-            Ok(MontyObject::Int(i))
-        } else {
-            // Extract as BigInt for values that don't fit in i64
-            let bi: BigInt = int.extract()?;
-            Ok(MontyObject::BigInt(bi))
-        }
+        int_to_monty(int)
     } else if let Ok(float) = obj.cast::<PyFloat>() {
         Ok(MontyObject::Float(float.extract()?))
     } else if let Ok(string) = obj.cast::<PyString>() {
         Ok(MontyObject::String(string.extract()?))
     } else if let Ok(bytes) = obj.cast::<PyBytes>() {
-        Ok(MontyObject::Bytes(bytes.extract()?))
+        Ok(bytes_to_monty(bytes))
     } else if let Ok(list) = obj.cast::<PyList>() {
-        let items: PyResult<Vec<MontyObject>> = list.iter().map(|item| py_to_monty(&item, dc_registry)).collect();
-        Ok(MontyObject::List(items?))
+        list_to_monty(list, dc_registry)
     } else if let Ok(tuple) = obj.cast::<PyTuple>() {
         // Check for namedtuple BEFORE treating as regular tuple
         // Namedtuples have a `_fields` attribute with field names
@@ -83,16 +82,9 @@ pub fn py_to_monty(obj: &Bound<'_, PyAny>, dc_registry: &DcRegistry) -> PyResult
             });
         }
         // Regular tuple
-        let items: PyResult<Vec<MontyObject>> = tuple.iter().map(|item| py_to_monty(&item, dc_registry)).collect();
-        Ok(MontyObject::Tuple(items?))
+        tuple_to_monty(tuple, dc_registry)
     } else if let Ok(dict) = obj.cast::<PyDict>() {
-        // in theory we could provide a way of passing the iterator direct to the internal MontyObject construct
-        // it's probably not worth it right now
-        Ok(MontyObject::dict(
-            dict.iter()
-                .map(|(k, v)| Ok((py_to_monty(&k, dc_registry)?, py_to_monty(&v, dc_registry)?)))
-                .collect::<PyResult<Vec<(MontyObject, MontyObject)>>>()?,
-        ))
+        dict_to_monty(dict, dc_registry)
     } else if let Ok(set) = obj.cast::<PySet>() {
         let items: PyResult<Vec<MontyObject>> = set.iter().map(|item| py_to_monty(&item, dc_registry)).collect();
         Ok(MontyObject::Set(items?))
@@ -118,6 +110,86 @@ pub fn py_to_monty(obj: &Bound<'_, PyAny>, dc_registry: &DcRegistry) -> PyResult
     }
 }
 
+/// Fast path for `py_to_monty` covering exact instances of the most common input types.
+///
+/// Exact type checks are a single pointer comparison, whereas `cast::<T>()` also has to
+/// accept subclasses. Returns `None` when `obj` isn't one of these exact types, in which
+/// case the caller falls back to the general conversion (which handles `bool`, subclasses,
+/// namedtuples, dataclasses etc.).
+///
+/// `bool` needs no special handling here since it's never an *exact* `int`.
+fn py_to_monty_exact(obj: &Bound<'_, PyAny>, dc_registry: &DcRegistry) -> Option<PyResult<MontyObject>> {
+    if let Ok(int) = obj.cast_exact::<PyInt>() {
+        Some(int_to_monty(int))
+    } else if let Ok(string) = obj.cast_exact::<PyString>() {
+        Some(string.extract().map(MontyObject::String))
+    } else if let Ok(float) = obj.cast_exact::<PyFloat>() {
+        Some(Ok(MontyObject::Float(float.value())))
+    } else if let Ok(bytes) = obj.cast_exact::<PyBytes>() {
+        Some(Ok(bytes_to_monty(bytes)))
+    } else if let Ok(list) = obj.cast_exact::<PyList>() {
+        Some(list_to_monty(list, dc_registry))
+    } else if let Ok(dict) = obj.cast_exact::<PyDict>() {
+        Some(dict_to_monty(dict, dc_registry))
+    } else if let Ok(tuple) = obj.cast_exact::<PyTuple>() {
+        // an exact tuple can't be a namedtuple, so skip the `_fields` lookup entirely
+        Some(tuple_to_monty(tuple, dc_registry))
+    } else {
+        None
+    }
+}
+
+/// Converts a Python `int` (or subclass), using `i64` when it fits and `BigInt` otherwise.
+fn int_to_monty(int: &Bound<'_, PyInt>) -> PyResult<MontyObject> {
+    // Try i64 first (fast path), fall back to BigInt for large values
+    if let Ok(i) = int.extract::<i64>() {
+        Ok(MontyObject::Int(i))
+    } else {
+        // Extract as BigInt for values that don't fit in i64
+        let bi: BigInt = int.extract()?;
+        Ok(MontyObject::BigInt(bi))
+    }
+}
+
+/// Converts a Python `bytes` (or subclass) with a single copy of its underlying buffer.
+///
+/// We deliberately avoid `extract::<Vec<u8>>()` here: PyO3 implements that via the generic
+/// sequence protocol, extracting every byte as a Python `int`. Monty needs to own the data
+/// (the value lives on Monty's heap and execution runs with the GIL released), so one
+/// `memcpy` out of the bytes object is the minimum.
+fn bytes_to_monty(bytes: &Bound<'_, PyBytes>) -> MontyObject {
+    MontyObject::Bytes(bytes.as_bytes().to_vec())
+}
+
+/// Converts a Python `list` (or subclass), preallocating the output to the list's length.
+fn list_to_monty(list: &Bound<'_, PyList>, dc_registry: &DcRegistry) -> PyResult<MontyObject> {
+    let mut items = Vec::with_capacity(list.len());
+    for item in list.iter() {
+        items.push(py_to_monty(&item, dc_registry)?);
+    }
+    Ok(MontyObject::List(items))
+}
+
+/// Converts a plain Python `tuple`, callers must handle namedtuples before calling this.
+fn tuple_to_monty(tuple: &Bound<'_, PyTuple>, dc_registry: &DcRegistry) -> PyResult<MontyObject> {
+    let mut items = Vec::with_capacity(tuple.len());
+    for item in tuple.iter() {
+        items.push(py_to_monty(&item, dc_registry)?);
+    }
+    Ok(MontyObject::Tuple(items))
+}
+
+/// Converts a Python `dict` (or subclass), preserving insertion order.
+fn dict_to_monty(dict: &Bound<'_, PyDict>, dc_registry: &DcRegistry) -> PyResult<MontyObject> {
+    // in theory we could provide a way of passing the iterator direct to the internal MontyObject construct
+    // it's probably not worth it right now
+    let mut pairs = Vec::with_capacity(dict.len());
+    for (k, v) in dict.iter() {
+        pairs.push((py_to_monty(&k, dc_registry)?, py_to_monty(&v, dc_registry)?));
+    }
+    Ok(MontyObject::dict(pairs))
+}
+
 /// Converts Monty's `MontyObject` to a native Python object, using the dataclass registry.
 ///
 /// When a dataclass is converted and its class name is found in the registry,
@@ -128,9 +200,11 @@ pub fn monty_to_py(py: Python<'_>, obj: &MontyObject, dc_registry: &DcRegistry)
         MontyObject::None => Ok(py.None()),
         MontyObject::Ellipsis => Ok(py.Ellipsis()),
         MontyObject::Bool(b) => Ok(PyBool::new(py, *b).to_owned().into_any().unbind()),
-        MontyObject::Int(i) => Ok(i.into_pyobject(py)?.clone().into_any().unbind()),
-        MontyObject::BigInt(bi) => Ok(bi.into_pyobject(py)?.clone().into_any().unbind()),
-        MontyObject::Float(f) => Ok(f.into_pyobject(py)?.clone().into_any().unbind()),
+        // `PyLong_FromLongLong` returns CPython's cached singletons for small ints, and these
+        // conversions already produce owned objects, so there's nothing to clone
+        MontyObject::Int(i) => Ok(i.into_pyobject(py)?.into_any().unbind()),
+        MontyObject::BigInt(bi) => Ok(bi.into_pyobject(py)?.into_any().unbind()),
+        MontyObject::Float(f) => Ok(f.into_pyobject(py)?.into_any().unbind()),
         MontyObject::String(s) => Ok(PyString::new(py, s).into_any().unbind()),
         MontyObject::Bytes(b) => Ok(PyBytes::new(py, b).into_any().unbind()),
         MontyObject::List(items) => {
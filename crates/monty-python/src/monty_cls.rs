@@ -12,7 +12,7 @@ use pyo3::{
     exceptions::{PyKeyError, PyRuntimeError, PyTypeError, PyValueError},
     intern,
     prelude::*,
-    types::{PyBytes, PyDict, PyList, PyTuple, PyType},
+    types::{PyBytes, PyDict, PyList, PyString, PyTuple, PyType},
 };
 use send_wrapper::SendWrapper;
 
@@ -38,6 +38,11 @@ pub struct PyMonty {
     script_name: String,
     /// Names of input variables expected by the code.
     input_names: Vec<String>,
+    /// Interned Python strings for `input_names`, in the same order.
+    ///
+    /// Used as the keys when looking up values in the `inputs` dict on every run, so we don't
+    /// create (and hash) a new Python string per input per call.
+    input_name_keys: Vec<Py<PyString>>,
     /// Names of external functions the code can call.
     external_function_names: Vec<String>,
     /// Registry of dataclass types for reconstructing original types on output.
@@ -78,13 +83,16 @@ impl PyMonty {
             py_type_check(py, &code, script_name, type_check_stubs)?;
         }
 
-        // Create the snapshot (parses the code)
-        let runner = MontyRun::new(code, script_name, input_names.clone(), external_function_names.clone())
+        // Create the snapshot (parses the code).
+        // Parsing and compiling don't touch any Python objects, so release the GIL while we do it.
+        let runner = py
+            .detach(|| MontyRun::new(code, script_name, input_names.clone(), external_function_names.clone()))
             .map_err(|e| MontyError::new_err(py, e))?;
 
         Ok(Self {
             runner,
             script_name: script_name.to_string(),
+            input_name_keys: intern_names(py, &input_names),
             input_names,
             external_function_names,
             dc_registry: DcRegistry::from_list(py, dataclass_registry)?,
@@ -265,6 +273,7 @@ impl PyMonty {
         Ok(Self {
             runner: serialized.runner,
             script_name: serialized.script_name,
+            input_name_keys: intern_names(py, &serialized.input_names),
             input_names: serialized.input_names,
             external_function_names: serialized.external_function_names,
             dc_registry: DcRegistry::from_list(py, dataclass_registry)?,
@@ -290,11 +299,16 @@ impl PyMonty {
     }
 }
 
+/// Type checks `code`, raising `MontyTypingError` if there are any diagnostics.
+///
+/// Type checking is by far the most expensive part of constructing a `Monty` and is pure Rust,
+/// so it runs with the GIL released to let other Python threads make progress.
 fn py_type_check(py: Python<'_>, code: &str, script_name: &str, type_stubs: Option<&str>) -> PyResult<()> {
     let type_stubs = type_stubs.map(|type_stubs| SourceFile::new(type_stubs, "type_stubs.pyi"));
 
-    let opt_diagnostics =
-        type_check(&SourceFile::new(code, script_name), type_stubs.as_ref()).map_err(PyRuntimeError::new_err)?;
+    let opt_diagnostics = py
+        .detach(|| type_check(&SourceFile::new(code, script_name), type_stubs.as_ref()))
+        .map_err(PyRuntimeError::new_err)?;
 
     if let Some(diagnostic) = opt_diagnostics {
         Err(MontyTypingError::new_err(py, diagnostic))
@@ -331,11 +345,13 @@ impl PyMonty {
         };
 
         // Extract values in declaration order
+        let py = inputs.py();
         self.input_names
             .iter()
-            .map(|name| {
+            .zip(&self.input_name_keys)
+            .map(|(name, key)| {
                 let value = inputs
-                    .get_item(name)?
+                    .get_item(key.bind(py))?
                     .ok_or_else(|| PyKeyError::new_err(format!("Missing required input: '{name}'")))?;
                 py_to_monty(&value, dc_registry)
             })
@@ -1348,6 +1364,11 @@ impl PyMontyComplete {
     }
 }
 
+/// Creates interned Python strings for a list of names, see `PyMonty::input_name_keys`.
+fn intern_names(py: Python<'_>, names: &[String]) -> Vec<Py<PyString>> {
+    names.iter().map(|name| PyString::intern(py, name).unbind()).collect()
+}
+
 fn list_str(arg: Option<&Bound<'_, PyList>>, name: &str) -> PyResult<Vec<String>> {
     if let Some(names) = arg {
         names
@@ -2,97 +2,111 @@
 """Update vendored typeshed files from the upstream repository.
 
 This script:
-1. Clones the typeshed repository to crates/monty-typeshed/typeshed-repo (or updates if it exists)
+1. Clones the typeshed repository to crates/monty-typeshed/typeshed-repo (or updates it if it exists
+   and `--update` is passed)
 2. Records the HEAD commit hash
 3. Filters builtins.pyi to keep only supported classes and functions
 4. Writes the filtered file to the vendor directory
 
 Usage:
-    python crates/monty-typeshed/update.py
+    python crates/monty-typeshed/update.py [--update]
 """
 
+import argparse
 import ast
+import hashlib
+import io
+import operator
 import shutil
 import subprocess
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
 # Whitelisted builtin functions (from crates/monty/src/builtins/)
-ALLOWED_FUNCTIONS = {
-    'abs',
-    'all',
-    'any',
-    'bin',
-    'chr',
-    'divmod',
-    'hash',
-    'hex',
-    'id',
-    'isinstance',
-    'len',
-    'max',
-    'min',
-    'oct',
-    'ord',
-    'pow',
-    'print',
-    'repr',
-    'round',
-    'sorted',
-    'sum',
-}
+# both allow lists are frozensets of identifier-like literals, which CPython interns just like the names
+# produced by `ast.parse`, so membership checks hit the identity fast path in the set lookup
+ALLOWED_FUNCTIONS = frozenset(
+    {
+        'abs',
+        'all',
+        'any',
+        'bin',
+        'chr',
+        'divmod',
+        'hash',
+        'hex',
+        'id',
+        'isinstance',
+        'len',
+        'max',
+        'min',
+        'oct',
+        'ord',
+        'pow',
+        'print',
+        'repr',
+        'round',
+        'sorted',
+        'sum',
+    }
+)
 
 # Whitelisted builtin classes (from crates/monty/src/types/ and exception_private.rs)
-ALLOWED_CLASSES = {
-    # Core types
-    'object',
-    'type',
-    # Primitive types
-    'bool',
-    'int',
-    'float',
-    # String/bytes types
-    'str',
-    'bytes',
-    # Container types
-    'list',
-    'tuple',
-    'dict',
-    'set',
-    'frozenset',
-    'range',
-    # Iterator types (these are classes, not functions)
-    'enumerate',
-    'reversed',
-    'zip',
-    # Slicing
-    'slice',
-    # property is used by pathlib.Path
-    'property',
-    # Exception hierarchy (from crates/monty/src/exception_private.rs)
-    'BaseException',
-    'Exception',
-    'SystemExit',
-    'KeyboardInterrupt',
-    'ArithmeticError',
-    'OverflowError',
-    'ZeroDivisionError',
-    'LookupError',
-    'IndexError',
-    'KeyError',
-    'RuntimeError',
-    'NotImplementedError',
-    'RecursionError',
-    'AttributeError',
-    'AssertionError',
-    'MemoryError',
-    'NameError',
-    'SyntaxError',
-    'OSError',
-    'TimeoutError',
-    'TypeError',
-    'ValueError',
-    'StopIteration',
-}
+ALLOWED_CLASSES = frozenset(
+    {
+        # Core types
+        'object',
+        'type',
+        # Primitive types
+        'bool',
+        'int',
+        'float',
+        # String/bytes types
+        'str',
+        'bytes',
+        # Container types
+        'list',
+        'tuple',
+        'dict',
+        'set',
+        'frozenset',
+        'range',
+        # Iterator types (these are classes, not functions)
+        'enumerate',
+        'reversed',
+        'zip',
+        # Slicing
+        'slice',
+        # property is used by pathlib.Path
+        'property',
+        # Exception hierarchy (from crates/monty/src/exception_private.rs)
+        'BaseException',
+        'Exception',
+        'SystemExit',
+        'KeyboardInterrupt',
+        'ArithmeticError',
+        'OverflowError',
+        'ZeroDivisionError',
+        'LookupError',
+        'IndexError',
+        'KeyError',
+        'RuntimeError',
+        'NotImplementedError',
+        'RecursionError',
+        'AttributeError',
+        'AssertionError',
+        'MemoryError',
+        'NameError',
+        'SyntaxError',
+        'OSError',
+        'TimeoutError',
+        'TypeError',
+        'ValueError',
+        'StopIteration',
+    }
+)
 
 # Files to copy without filtering
 COPY_FILES = [
@@ -139,47 +153,102 @@ typing_extensions: 3.7-
 types: 3.0-
 """
 
+# Python version monty type checks against, must match `python_version()` in crates/monty-type-checking/src/db.rs,
+# `if sys.version_info ...` blocks in builtins.pyi are resolved against this version
+TARGET_VERSION = (3, 14)
+
+# comparison operators we know how to evaluate in `sys.version_info` guards
+VERSION_GUARD_OPS: dict[type[ast.cmpop], Callable[[Any, Any], bool]] = {
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
 CRATE_DIR = Path(__file__).parent
 REPO_ROOT = CRATE_DIR.parent.parent
 VENDOR_DIR = CRATE_DIR / 'vendor' / 'typeshed'
 STDLIB_DIR = VENDOR_DIR / 'stdlib'
 CUSTOM_DIR = CRATE_DIR / 'custom'
 TYPESHED_REPO_DIR = CRATE_DIR / 'typeshed-repo'
+CACHE_DIR = CRATE_DIR / '.cache'
 
 TYPESHED_REPO_URL = 'git@github.com:python/typeshed.git'
 
 
-def clone_or_update_typeshed() -> str:
-    """Clone or update the typeshed repository and return the path and HEAD commit hash.
+def clone_or_update_typeshed(update: bool) -> str:
+    """Clone or update the typeshed repository and return the HEAD commit hash.
+
+    If the repository doesn't exist at TYPESHED_REPO_DIR it's cloned (shallowly) to that location.
+    If it already exists it's left untouched unless `update` is set, in which case the latest
+    upstream commit is fetched (again shallowly) and checked out.
 
-    If the repository already exists at TYPESHED_REPO_DIR, performs a git pull.
-    Otherwise, clones the repository to that location.
+    Args:
+        update: Whether to refresh an existing checkout from upstream.
 
     Returns:
         commit_hash
     """
-    if TYPESHED_REPO_DIR.exists():
-        print(f'{TYPESHED_REPO_DIR} exists, not pulling')
-    else:
+    if not TYPESHED_REPO_DIR.exists():
         print(f'Cloning typeshed to {TYPESHED_REPO_DIR}...')
         subprocess.run(
             ['git', 'clone', '--depth=1', TYPESHED_REPO_URL, str(TYPESHED_REPO_DIR)],
             check=True,
             capture_output=True,
         )
+    elif update:
+        print(f'Updating {TYPESHED_REPO_DIR}...')
+        subprocess.run(
+            ['git', 'fetch', '--depth=1', 'origin', 'HEAD'], cwd=TYPESHED_REPO_DIR, check=True, capture_output=True
+        )
+        subprocess.run(['git', 'reset', '--hard', 'FETCH_HEAD'], cwd=TYPESHED_REPO_DIR, check=True, capture_output=True)
+    else:
+        print(f'{TYPESHED_REPO_DIR} exists, not pulling (use --update to fetch the latest typeshed)')
+
+    return read_head_commit(TYPESHED_REPO_DIR)
 
-    result = subprocess.run(
-        ['git', 'rev-parse', 'HEAD'],
-        cwd=TYPESHED_REPO_DIR,
-        check=True,
-        capture_output=True,
-        text=True,
-    )
-    return result.stdout.strip()
 
+def read_head_commit(repo_dir: Path) -> str:
+    """Read the commit hash of HEAD directly from a repository's `.git` directory.
 
-def filter_statements(nodes: list[ast.stmt]) -> list[ast.stmt]:
-    """Filter a list of statements to keep only allowed functions and classes.
+    Equivalent to `git rev-parse HEAD` without the cost of spawning a subprocess.
+
+    Args:
+        repo_dir: Root of a (non-bare) git checkout.
+
+    Returns:
+        The full commit hash HEAD points at.
+    """
+    git_dir = repo_dir / '.git'
+    head = (git_dir / 'HEAD').read_text().strip()
+    if not head.startswith('ref: '):
+        # detached HEAD, i.e. HEAD checked out at a bare commit rather than a branch
+        return head
+
+    ref = head.removeprefix('ref: ')
+    ref_file = git_dir / ref
+    if ref_file.exists():
+        return ref_file.read_text().strip()
+
+    # the ref may have been packed, in which case it lives in `packed-refs` as "<hash> <ref>" lines
+    packed_refs = git_dir / 'packed-refs'
+    if packed_refs.exists():
+        for line in packed_refs.read_text().splitlines():
+            commit, _, name = line.partition(' ')
+            if name == ref:
+                return commit
+    raise ValueError(f'Unable to resolve {ref!r} in {repo_dir}')
+
+
+# statements BuiltinsFilter may remove or rewrite, everything else is always kept as is
+FILTERED_STATEMENTS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.If)
+
+
+class BuiltinsFilter(ast.NodeTransformer):
+    """Filter builtins.pyi statements in place to keep only allowed functions and classes.
+
+    `if sys.version_info ...` blocks which can be resolved against TARGET_VERSION are replaced
+    by the statements of the branch that applies, other `if` blocks are filtered recursively.
 
     Keeps:
     - Imports
@@ -187,56 +256,109 @@ def filter_statements(nodes: list[ast.stmt]) -> list[ast.stmt]:
     - Allowed function definitions
     - Allowed class definitions
 
+    Only statement lists of the module and of `if` blocks are filtered, the visitor never
+    descends into class bodies or expressions.
+
+    Use `visit(tree)` on the parsed module; afterwards `rewritten` holds the ids of kept nodes
+    whose contents were changed, these can no longer be emitted using their original source.
+    """
+
+    def __init__(self) -> None:
+        self.rewritten: set[int] = set()
+
+    def filter_body(self, nodes: list[ast.stmt]) -> list[ast.stmt]:
+        """Visit each statement, dropping removed statements and splicing in lifted ones."""
+        result: list[ast.stmt] = []
+        for node in nodes:
+            match self.visit(node):
+                case None:
+                    pass
+                case list() as lifted:
+                    result.extend(lifted)
+                case kept:
+                    result.append(kept)
+        return result
+
+    def visit_Module(self, node: ast.Module) -> ast.Module:
+        node.body = self.filter_body(node.body)
+        return node
+
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> ast.stmt | None:
+        return node if node.name in ALLOWED_FUNCTIONS else None
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> ast.stmt | None:
+        return node if node.name.startswith('_') or node.name in ALLOWED_CLASSES else None
+
+    def visit_If(self, node: ast.If) -> ast.stmt | list[ast.stmt] | None:
+        guard = eval_version_guard(node.test)
+        if guard is True:
+            # the guard always holds for TARGET_VERSION, inline the body
+            return self.filter_body(node.body)
+        elif guard is False:
+            # the guard can never hold, only the else branch is reachable
+            return self.filter_body(node.orelse)
+
+        if not any(isinstance(child, FILTERED_STATEMENTS) for child in (*node.body, *node.orelse)):
+            # e.g. a guard around imports or TypeVar assignments: nothing in it can be removed, so
+            # skip the recursion and leave the node untouched so it's emitted from its original source
+            return node
+
+        node.body = self.filter_body(node.body)
+        node.orelse = self.filter_body(node.orelse)
+        # If both branches are empty, skip this if block entirely
+        if not node.body and not node.orelse:
+            return None
+        if not node.body:
+            node.body = [ast.Pass()]
+        self.rewritten.add(id(node))
+        return node
+
+    def generic_visit(self, node: ast.AST) -> ast.AST:
+        # Keep imports, type aliases, assignments, etc. as is without visiting their children
+        return node
+
+
+def eval_version_guard(test: ast.expr) -> bool | None:
+    """Statically evaluate a `sys.version_info <op> (X, Y)` condition against TARGET_VERSION.
+
+    Only the narrow form typeshed uses is recognised, anything else (e.g. `sys.platform` checks
+    or boolean combinations) returns None so the caller keeps the whole `if` block.
+
     Args:
-        nodes: List of AST statement nodes.
+        test: The test expression of an `ast.If` node.
 
     Returns:
-        Filtered list of statements.
+        True or False if the guard can be resolved, None otherwise.
     """
-    result: list[ast.stmt] = []
-    for node in nodes:
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            if node.name in ALLOWED_FUNCTIONS:
-                result.append(node)
-        elif isinstance(node, ast.ClassDef):
-            if node.name.startswith('_') or node.name in ALLOWED_CLASSES:
-                result.append(node)
-        elif isinstance(node, ast.If):
-            # Recursively filter version-conditional blocks
-            filtered = filter_if_block(node)
-            if filtered is not None:
-                result.append(filtered)
-        else:
-            # Keep imports, type aliases, assignments, etc.
-            result.append(node)
-    return result
+    match test:
+        case ast.Compare(
+            left=ast.Attribute(value=ast.Name(id='sys'), attr='version_info'),
+            ops=[op],
+            comparators=[ast.Tuple(elts=elts)],
+        ) if type(op) in VERSION_GUARD_OPS and all(isinstance(e, ast.Constant) for e in elts):
+            version = tuple(e.value for e in elts)
+            return VERSION_GUARD_OPS[type(op)](TARGET_VERSION, version)
+        case _:
+            return None
 
 
-def filter_if_block(node: ast.If) -> ast.If | None:
-    """Filter an if block, recursively filtering function and class definitions.
-
-    Handles version conditionals like `if sys.version_info >= (3, 10):`.
+def statement_source(lines: list[str], node: ast.stmt) -> str:
+    """Get the verbatim source of a top level statement, including any decorators.
 
     Args:
-        node: An ast.If node.
+        lines: The source file split with `str.splitlines()`.
+        node: A statement from the module body with its original location information.
 
     Returns:
-        Filtered If node, or None if both branches are empty after filtering.
+        The source lines spanned by the statement.
     """
-    filtered_body = filter_statements(node.body)
-    filtered_orelse = filter_statements(node.orelse)
-
-    # If both branches are empty, skip this if block entirely
-    if not filtered_body and not filtered_orelse:
-        return None
-
-    # Create a new If node with filtered contents
-    new_node = ast.If(
-        test=node.test,
-        body=filtered_body if filtered_body else [ast.Pass()],
-        orelse=filtered_orelse,
-    )
-    return ast.copy_location(new_node, node)
+    start = node.lineno
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)) and node.decorator_list:
+        start = node.decorator_list[0].lineno
+    assert node.end_lineno is not None, 'parsed nodes always have an end line'
+    return '\n'.join(lines[start - 1 : node.end_lineno])
 
 
 def filter_builtins(source: str) -> str:
@@ -246,6 +368,10 @@ def filter_builtins(source: str) -> str:
     top-level definitions to only include those in the allow lists.
     All imports and type definitions are preserved.
 
+    Statements kept unchanged at the top level are copied verbatim from `source`,
+    only statements the filter rewrote (or moved out of an `if` block) are unparsed.
+    Unparsing is by far the most expensive step, and most of the output is untouched.
+
     Args:
         source: The source code of builtins.pyi.
 
@@ -253,29 +379,68 @@ def filter_builtins(source: str) -> str:
         Filtered source code.
     """
     tree = ast.parse(source)
-    tree.body = filter_statements(tree.body)
-    ast.fix_missing_locations(tree)
-    return ast.unparse(tree)
+    lines = source.splitlines()
+    top_level = {id(node) for node in tree.body}
+    builtins_filter = BuiltinsFilter()
+    builtins_filter.visit(tree)
+    # write each statement as soon as it's rendered so its (potentially large) unparsed fragment
+    # can be freed straight away rather than holding every fragment until a final join
+    output = io.StringIO()
+    for node in tree.body:
+        if id(node) in top_level and id(node) not in builtins_filter.rewritten:
+            output.write(statement_source(lines, node))
+        else:
+            output.write(ast.unparse(ast.fix_missing_locations(node)))
+        output.write('\n')
+    return output.getvalue()
+
+
+def filter_builtins_cached(commit: str, builtins_path: Path) -> str:
+    """Filter builtins.pyi, reusing the result of a previous run with the same inputs if there is one.
+
+    The cache key is the typeshed commit plus a hash of this script, the script hash covers the
+    allow lists, TARGET_VERSION and the filtering logic itself, so editing any of them invalidates
+    the cache. Cached results live in CACHE_DIR, which is gitignored.
+
+    Args:
+        commit: The typeshed commit `builtins_path` was checked out from.
+        builtins_path: Path to the unfiltered builtins.pyi.
+
+    Returns:
+        Filtered source code.
+    """
+    script_hash = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8).hexdigest()
+    cache_file = CACHE_DIR / f'builtins-{commit}-{script_hash}.pyi'
+    if cache_file.exists():
+        print(f'Using cached {cache_file.relative_to(REPO_ROOT)}')
+        return cache_file.read_text()
+
+    filtered = filter_builtins(builtins_path.read_text())
+    CACHE_DIR.mkdir(exist_ok=True)
+    cache_file.write_text(filtered)
+    return filtered
 
 
 def main() -> int:
     """Main entry point."""
+    parser = argparse.ArgumentParser(description='Update vendored typeshed files from the upstream repository.')
+    parser.add_argument(
+        '--update', action='store_true', help='fetch the latest typeshed commit if the repository already exists'
+    )
+    args = parser.parse_args()
+
     # Clean up any stale files from previous runs
     if VENDOR_DIR.exists():
         print(f'Removing existing {VENDOR_DIR}...')
         shutil.rmtree(VENDOR_DIR)
 
     # Clone or update typeshed
-    commit = clone_or_update_typeshed()
+    commit = clone_or_update_typeshed(args.update)
     print(f'At python/typeshed commit {commit}')
 
-    # Read source file
+    # Filter builtins.pyi
     src_stdlib = TYPESHED_REPO_DIR / 'stdlib'
-    builtins_path = src_stdlib / 'builtins.pyi'
-    source = builtins_path.read_text()
-
-    # Filter
-    filtered = filter_builtins(source)
+    filtered = filter_builtins_cached(commit, src_stdlib / 'builtins.pyi')
 
     # Write output files
     STDLIB_DIR.mkdir(parents=True, exist_ok=True)
@@ -289,22 +454,29 @@ def main() -> int:
     (VENDOR_DIR / 'source_commit.txt').write_text(commit + '\n')
     print(f'Wrote {(VENDOR_DIR / "source_commit.txt").relative_to(REPO_ROOT)}')
 
+    # build the full list of copies up front, creating destination directories here (single threaded)
+    # so the worker threads below never race on `mkdir`
+    copies: list[tuple[Path, Path]] = []
     for file_path in COPY_FILES:
         src_file = src_stdlib / file_path
         if src_file.exists():
             dest_file = STDLIB_DIR / file_path
             dest_file.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src_file, dest_file)
+            copies.append((src_file, dest_file))
         else:
             raise ValueError(f'{file_path} not found in typeshed')
-    print(f'Copied {len(COPY_FILES)} stdlib typeshed files')
 
     # copy pyi files from CUSTOM_DIR into STDLIB_DIR
-    custom_count = 0
-    for file in CUSTOM_DIR.glob('*.pyi'):
-        shutil.copy2(file, STDLIB_DIR)
-        custom_count += 1
-    print(f'Copied {custom_count} custom typeshed files')
+    custom_files = list(CUSTOM_DIR.glob('*.pyi'))
+    copies.extend((file, STDLIB_DIR / file.name) for file in custom_files)
+
+    # copying is I/O bound and releases the GIL, so overlap the copies with threads
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # consume the iterator so any exception from a copy is raised here
+        list(executor.map(lambda copy: shutil.copy2(*copy), copies))
+
+    print(f'Copied {len(COPY_FILES)} stdlib typeshed files')
+    print(f'Copied {len(custom_files)} custom typeshed files')
 
     return 0
 
@@ -313,6 +313,19 @@ impl HeapData {
             Self::LongInt(li) => Some(li.hash()),
         }
     }
+
+    /// Returns the fixed repr of an empty list, tuple or dict, or `None` for anything else.
+    ///
+    /// Lets `repr()` and `str()` hand back a static string for these without formatting
+    /// into a freshly allocated `String`.
+    pub fn empty_repr(&self) -> Option<&'static str> {
+        match self {
+            Self::List(list) if list.as_slice().is_empty() => Some("[]"),
+            Self::Tuple(tuple) if tuple.as_slice().is_empty() => Some("()"),
+            Self::Dict(dict) if dict.is_empty() => Some("{}"),
+            _ => None,
+        }
+    }
 }
 
 /// Manual implementation of AbstractValue dispatch for HeapData.
@@ -596,7 +609,9 @@ impl PyTrait for HeapData {
             // Paths return the path string without the PosixPath() wrapper
             Self::Path(p) => Cow::Owned(p.as_str().to_owned()),
             // All other types use repr
-            _ => self.py_repr(heap, guard, interns),
+            _ => self
+                .empty_repr()
+                .map_or_else(|| self.py_repr(heap, guard, interns), Cow::Borrowed),
         }
     }
 
@@ -1091,6 +1106,20 @@ impl<T: ResourceTracker> Heap<T> {
         value.refcount += 1;
     }
 
+    /// Increments the reference count by `n`, equivalent to calling `inc_ref` `n` times.
+    ///
+    /// # Panics
+    /// Panics if the value ID is invalid or the value has already been freed.
+    pub fn inc_ref_by(&mut self, id: HeapId, n: usize) {
+        let value = self
+            .entries
+            .get_mut(id.index())
+            .expect("Heap::inc_ref_by: slot missing")
+            .as_mut()
+            .expect("Heap::inc_ref_by: object already freed");
+        value.refcount += n;
+    }
+
     /// Decrements the reference count and frees the value (plus children) once it hits zero.
     ///
     /// When an value is freed, its slot ID is added to the free list for reuse by
@@ -1399,6 +1428,38 @@ impl<T: ResourceTracker> Heap<T> {
         }
     }
 
+    /// Helper for `list.extend()`: extends the destination vec with items from a heap list or tuple.
+    ///
+    /// Reserves the final size up front and copies items straight from the source's storage,
+    /// rather than pulling them one by one through a `MontyIter` into an intermediate buffer.
+    /// Uses the same take/restore pattern as `iadd_extend_list`.
+    ///
+    /// Returns `true` if successful, `false` if the source ID is neither a List nor a Tuple.
+    pub fn extend_from_sequence(&mut self, source_id: HeapId, dest: &mut Vec<Value>) -> bool {
+        let source_data = take_data!(self, source_id, "extend_from_sequence");
+
+        let items = match &source_data {
+            HeapData::List(list) => list.as_slice(),
+            HeapData::Tuple(tuple) => tuple.as_slice(),
+            _ => {
+                restore_data!(self, source_id, source_data, "extend_from_sequence");
+                return false;
+            }
+        };
+
+        dest.reserve(items.len());
+        for item in items {
+            // inc_ref only touches the refcount, so it's fine for the source's data to be taken here
+            if let Value::Ref(id) = item {
+                self.inc_ref(*id);
+            }
+            dest.push(item.copy_for_extend());
+        }
+
+        restore_data!(self, source_id, source_data, "extend_from_sequence");
+        true
+    }
+
     /// Multiplies a heap-allocated value by an `i64`.
     ///
     /// If `id` refers to a `LongInt`, performs integer multiplication with a size
@@ -1484,108 +1545,29 @@ impl<T: ResourceTracker> Heap<T> {
         // Take the data out to avoid borrow conflicts
         let data = take_data!(self, id, "mult_sequence");
 
+        // Each arm builds the repeated contents while the source is taken out, then restores it
+        // before propagating any error so the entry is never left empty
         match &data {
             HeapData::Str(s) => {
-                check_repeat_size(s.len(), count, &self.tracker)?;
-                let repeated = s.as_str().repeat(count);
+                let repeated = check_repeat_size(s.len(), count, &self.tracker).map(|()| s.as_str().repeat(count));
                 restore_data!(self, id, data, "mult_sequence");
-                Ok(Some(Value::Ref(self.allocate(HeapData::Str(repeated.into()))?)))
+                Ok(Some(Value::Ref(self.allocate(HeapData::Str(repeated?.into()))?)))
             }
             HeapData::Bytes(b) => {
-                check_repeat_size(b.len(), count, &self.tracker)?;
-                let repeated = b.as_slice().repeat(count);
+                let repeated = check_repeat_size(b.len(), count, &self.tracker).map(|()| b.as_slice().repeat(count));
                 restore_data!(self, id, data, "mult_sequence");
-                Ok(Some(Value::Ref(self.allocate(HeapData::Bytes(repeated.into()))?)))
+                Ok(Some(Value::Ref(self.allocate(HeapData::Bytes(repeated?.into()))?)))
             }
             HeapData::List(list) => {
-                if count == 0 {
-                    restore_data!(self, id, data, "mult_sequence");
-                    Ok(Some(Value::Ref(self.allocate(HeapData::List(List::new(Vec::new())))?)))
-                } else {
-                    // Pre-check memory limit for large results
-                    check_repeat_size(list.len().saturating_mul(size_of::<Value>()), count, &self.tracker)?;
-
-                    // Copy items and track which refs need incrementing
-                    let items: Vec<Value> = list.as_slice().iter().map(Value::copy_for_extend).collect();
-                    let ref_ids: Vec<HeapId> = items.iter().filter_map(Value::ref_id).collect();
-                    let original_len = items.len();
-
-                    // Restore data before heap operations
-                    restore_data!(self, id, data, "mult_sequence");
-
-                    // Now increment refcounts for each copy we'll make
-                    // We need (count) copies of each ref
-                    for ref_id in &ref_ids {
-                        for _ in 0..count {
-                            self.inc_ref(*ref_id);
-                        }
-                    }
-
-                    // Build the repeated list with overflow check
-                    let capacity = original_len
-                        .checked_mul(count)
-                        .ok_or_else(ExcType::overflow_repeat_count)?;
-                    let mut result = Vec::with_capacity(capacity);
-                    for _ in 0..count {
-                        self.check_time()?;
-                        for item in &items {
-                            result.push(item.copy_for_extend());
-                        }
-                    }
-
-                    // Manually forget the items vec to avoid Drop panic
-                    // The values have been copied to result with proper refcounts
-                    std::mem::forget(items);
-
-                    Ok(Some(Value::Ref(self.allocate(HeapData::List(List::new(result)))?)))
-                }
+                let items = self.repeat_items(list.as_slice(), count);
+                restore_data!(self, id, data, "mult_sequence");
+                Ok(Some(Value::Ref(self.allocate(HeapData::List(List::new(items?)))?)))
             }
             HeapData::Tuple(tuple) => {
-                if count == 0 {
-                    restore_data!(self, id, data, "mult_sequence");
-                    // Use empty tuple singleton
-                    Ok(Some(self.get_empty_tuple()))
-                } else {
-                    // Pre-check memory limit for large results
-                    check_repeat_size(
-                        tuple.as_slice().len().saturating_mul(size_of::<Value>()),
-                        count,
-                        &self.tracker,
-                    )?;
-
-                    // Copy items and track which refs need incrementing
-                    let items: Vec<Value> = tuple.as_slice().iter().map(Value::copy_for_extend).collect();
-                    let ref_ids: Vec<HeapId> = items.iter().filter_map(Value::ref_id).collect();
-                    let original_len = items.len();
-
-                    // Restore data before heap operations
-                    restore_data!(self, id, data, "mult_sequence");
-
-                    // Now increment refcounts for each copy we'll make
-                    // We need (count) copies of each ref
-                    for ref_id in &ref_ids {
-                        for _ in 0..count {
-                            self.inc_ref(*ref_id);
-                        }
-                    }
-
-                    // Build the repeated tuple with overflow check
-                    let capacity = original_len
-                        .checked_mul(count)
-                        .ok_or_else(ExcType::overflow_repeat_count)?;
-                    let mut result = SmallVec::with_capacity(capacity);
-                    for _ in 0..count {
-                        self.check_time()?;
-                        for item in &items {
-                            result.push(item.copy_for_extend());
-                        }
-                    }
-
-                    // Manually forget the items vec to avoid Drop panic
-                    std::mem::forget(items);
-
-                    Ok(Some(allocate_tuple(result, self)?))
-                }
+                let items = self.repeat_items(tuple.as_slice(), count);
+                restore_data!(self, id, data, "mult_sequence");
+                // allocate_tuple returns the empty tuple singleton for a zero count
+                Ok(Some(allocate_tuple(SmallVec::from_vec(items?), self)?))
             }
             _ => {
                 // Dicts, Cells, Callables, Functions and Closures don't support multiplication
@@ -1595,6 +1577,40 @@ impl<T: ResourceTracker> Heap<T> {
         }
     }
 
+    /// Builds `count` back-to-back copies of `items` for list and tuple repetition.
+    ///
+    /// The result is allocated once at its final size and each repetition is a straight copy
+    /// of the source slice. Rather than incrementing refcounts once per copied item, each ref
+    /// in `items` has its refcount raised by `count` in a single step once all copies are made.
+    ///
+    /// Only refcounts are touched, so this is safe to call while the entry owning `items` is
+    /// taken out via `take_data!`.
+    fn repeat_items(&mut self, items: &[Value], count: usize) -> RunResult<Vec<Value>> {
+        // Pre-check memory limit for large results
+        check_repeat_size(items.len().saturating_mul(size_of::<Value>()), count, &self.tracker)?;
+        let capacity = items
+            .len()
+            .checked_mul(count)
+            .ok_or_else(ExcType::overflow_repeat_count)?;
+
+        let mut result = Vec::with_capacity(capacity);
+        for _ in 0..count {
+            if let Err(e) = self.check_time() {
+                // no refcounts have been taken for the copies yet, so they must be forgotten, not dropped
+                result.into_iter().for_each(std::mem::forget);
+                return Err(e.into());
+            }
+            result.extend(items.iter().map(Value::copy_for_extend));
+        }
+
+        if count > 0 {
+            for id in items.iter().filter_map(Value::ref_id) {
+                self.inc_ref_by(id, count);
+            }
+        }
+        Ok(result)
+    }
+
     /// Returns whether garbage collection should run.
     ///
     /// True if reference cycles count exist in the heap
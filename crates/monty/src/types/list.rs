@@ -13,7 +13,7 @@ use crate::{
     intern::{Interns, StaticStrings},
     io::PrintWriter,
     resource::{DepthGuard, ResourceError, ResourceTracker},
-    types::Type,
+    types::{Type, str::str_chars},
     value::{EitherStr, Value},
 };
 
@@ -152,7 +152,8 @@ impl List {
             heap.mark_potential_cycle();
         }
         // Ownership transfer - refcount was already handled by caller
-        // Python's insert() appends if index is out of bounds
+        // Python's insert() appends if index is out of bounds; appending also skips the
+        // shift of the tail that Vec::insert does (as a single memmove) otherwise
         if index >= self.items.len() {
             self.items.push(item);
         } else {
@@ -160,6 +161,17 @@ impl List {
         }
     }
 
+    /// Updates `contains_refs` after items were pushed directly onto `items` from index `prev_len`.
+    ///
+    /// Marks a potential cycle only if one of the new items is a ref, matching what `append()` does
+    /// for a single item.
+    fn track_refs_since(&mut self, prev_len: usize, heap: &mut Heap<impl ResourceTracker>) {
+        if self.items[prev_len..].iter().any(|item| matches!(item, Value::Ref(_))) {
+            self.contains_refs = true;
+            heap.mark_potential_cycle();
+        }
+    }
+
     /// Creates a list from the `list()` constructor call.
     ///
     /// - `list()` with no args returns an empty list
@@ -172,7 +184,15 @@ impl List {
                 Ok(Value::Ref(heap_id))
             }
             Some(v) => {
-                let items = MontyIter::new(v, heap, interns)?.collect(heap, interns)?;
+                let items = if let Some(chars) = str_chars(&v, heap, interns) {
+                    v.drop_with_heap(heap);
+                    chars?
+                } else if let Some(keys) = dict_keys(&v, heap) {
+                    v.drop_with_heap(heap);
+                    keys
+                } else {
+                    MontyIter::new(v, heap, interns)?.collect(heap, interns)?
+                };
                 let heap_id = heap.allocate(HeapData::List(Self::new(items)))?;
                 Ok(Value::Ref(heap_id))
             }
@@ -225,18 +245,9 @@ impl PyTrait for List {
         // Extract integer index, accepting Int, Bool (True=1, False=0), and LongInt
         let index = key.as_index(heap, Type::List)?;
 
-        // Convert to usize, handling negative indices (Python-style: -1 = last element)
-        let len = i64::try_from(self.items.len()).expect("list length exceeds i64::MAX");
-        let normalized_index = if index < 0 { index + len } else { index };
-
-        // Bounds check
-        if normalized_index < 0 || normalized_index >= len {
-            return Err(ExcType::list_index_error());
-        }
+        let idx = resolve_list_index(index, self.items.len()).ok_or_else(ExcType::list_index_error)?;
 
         // Return clone of the item with proper refcount increment
-        // Safety: normalized_index is validated to be in [0, len) above
-        let idx = usize::try_from(normalized_index).expect("list index validated non-negative");
         Ok(self.items[idx].clone_with_heap(heap))
     }
 
@@ -276,16 +287,7 @@ impl PyTrait for List {
             }
         };
 
-        // Normalize negative indices (Python-style: -1 = last element)
-        let len = i64::try_from(self.items.len()).expect("list length exceeds i64::MAX");
-        let normalized_index = if index < 0 { index + len } else { index };
-
-        // Bounds check
-        if normalized_index < 0 || normalized_index >= len {
-            return Err(ExcType::list_assignment_index_error());
-        }
-
-        let idx = usize::try_from(normalized_index).expect("index validated non-negative");
+        let idx = resolve_list_index(index, self.items.len()).ok_or_else(ExcType::list_assignment_index_error)?;
 
         // Update contains_refs if storing a Ref (must check before swap,
         // since after swap `value` holds the old item)
@@ -377,17 +379,18 @@ impl PyTrait for List {
         let Value::Ref(other_id) = &other else { return Ok(false) };
 
         if Some(*other_id) == self_id {
-            // Self-extend: clone our own items with proper refcounting
-            let items = self
-                .items
-                .iter()
-                .map(|obj| obj.clone_with_heap(heap))
-                .collect::<Vec<_>>();
+            // Self-extend: reserve once, then append a refcounted copy of each original item
+            // in place, without collecting the copies into a temporary vec first
+            let len = self.items.len();
+            self.items.reserve(len);
+            for i in 0..len {
+                let item = self.items[i].clone_with_heap(heap);
+                self.items.push(item);
+            }
             // If we're self-extending and have refs, mark potential cycle
             if self.contains_refs {
                 heap.mark_potential_cycle();
             }
-            self.items.extend(items);
         } else {
             // Get items from other list using iadd_extend_from_heap helper
             // This handles the borrow checker limitations with lifetime propagation
@@ -395,19 +398,7 @@ impl PyTrait for List {
             if !heap.iadd_extend_list(*other_id, &mut self.items) {
                 return Ok(false);
             }
-            // Check if we added any refs and mark potential cycle
-            if self.contains_refs {
-                // Already had refs, but adding more may create cycles
-                heap.mark_potential_cycle();
-            } else {
-                for item in &self.items[prev_len..] {
-                    if matches!(item, Value::Ref(_)) {
-                        self.contains_refs = true;
-                        heap.mark_potential_cycle();
-                        break;
-                    }
-                }
-            }
+            self.track_refs_since(prev_len, heap);
         }
 
         // Drop the other value - we've extracted its contents and are done with the temporary reference
@@ -502,26 +493,29 @@ fn call_list_method(
     }
 }
 
+/// Returns the keys of a dict value for `list(d)`, or `None` if `value` isn't a dict.
+///
+/// Copies the keys straight out of the dict's entries into a vec of the right size, rather
+/// than stepping a `MontyIter` (with its per-item mutation checks) over the dict.
+fn dict_keys(value: &Value, heap: &mut Heap<impl ResourceTracker>) -> Option<Vec<Value>> {
+    let Value::Ref(id) = value else {
+        return None;
+    };
+    heap.with_entry_mut(*id, |heap, data| match data {
+        HeapData::Dict(dict) => Some(dict.keys(heap)),
+        _ => None,
+    })
+}
+
 /// Implements Python's `list.insert(index, item)` method.
 fn list_insert(list: &mut List, args: ArgValues, heap: &mut Heap<impl ResourceTracker>) -> RunResult<Value> {
     let (index_obj, item) = args.get_two_args("insert", heap)?;
     defer_drop!(index_obj, heap);
     let mut item_guard = HeapGuard::new(item, heap);
     let heap = item_guard.heap();
-    // Python's insert() handles negative indices by adding len
-    // If still negative after adding len, clamps to 0
-    // If >= len, appends to end
-    let index_i64 = index_obj.as_int(heap)?;
-    let len = list.items.len();
-    let len_i64 = i64::try_from(len).expect("list length exceeds i64::MAX");
-    let index = if index_i64 < 0 {
-        // Negative index: add length, clamp to 0 if still negative
-        let adjusted = index_i64 + len_i64;
-        usize::try_from(adjusted).unwrap_or(0)
-    } else {
-        // Positive index: clamp to len if too large
-        usize::try_from(index_i64).unwrap_or(len)
-    };
+    // Python's insert() clamps the index to [0, len] after adding len to negative indices,
+    // exactly the normalization list.index() uses for its bounds
+    let index = normalize_list_index(index_obj.as_int(heap)?, list.items.len());
     let (item, heap) = item_guard.into_parts();
     list.insert(heap, index, item);
     Ok(Value::None)
@@ -534,14 +528,17 @@ fn list_insert(list: &mut List, args: ArgValues, heap: &mut Heap<impl ResourceTr
 fn list_pop(list: &mut List, args: ArgValues, heap: &mut Heap<impl ResourceTracker>) -> RunResult<Value> {
     let index_arg = args.get_zero_one_arg("list.pop", heap)?;
 
-    // Validate index type FIRST (if provided), matching Python's validation order.
+    // Fast path for the common `pop()`: take the last item without any index normalization
+    let Some(index_arg) = index_arg else {
+        return list.items.pop().ok_or_else(ExcType::index_error_pop_empty_list);
+    };
+
+    // Validate index type FIRST, matching Python's validation order.
     // Python raises TypeError for bad index type even on empty list.
-    let index_i64 = if let Some(v) = index_arg {
-        let result = v.as_int(heap);
-        v.drop_with_heap(heap);
+    let index_i64 = {
+        let result = index_arg.as_int(heap);
+        index_arg.drop_with_heap(heap);
         result?
-    } else {
-        -1
     };
 
     // THEN check empty list
@@ -549,18 +546,8 @@ fn list_pop(list: &mut List, args: ArgValues, heap: &mut Heap<impl ResourceTrack
         return Err(ExcType::index_error_pop_empty_list());
     }
 
-    // Normalize index
-    let len = list.items.len();
-    let len_i64 = i64::try_from(len).expect("list length exceeds i64::MAX");
-    let normalized = if index_i64 < 0 { index_i64 + len_i64 } else { index_i64 };
-
-    // Bounds check
-    if normalized < 0 || normalized >= len_i64 {
-        return Err(ExcType::index_error_pop_out_of_range());
-    }
-
     // Remove and return the item
-    let idx = usize::try_from(normalized).expect("index validated non-negative");
+    let idx = resolve_list_index(index_i64, list.items.len()).ok_or_else(ExcType::index_error_pop_out_of_range)?;
     Ok(list.items.remove(idx))
 }
 
@@ -581,7 +568,7 @@ fn list_remove(
     let mut guard = DepthGuard::default();
     for (i, item) in list.items.iter().enumerate() {
         heap.check_time()?;
-        if value.py_eq(item, heap, &mut guard, interns)? {
+        if eq_or_identical(value, item, heap, &mut guard, interns)? {
             found_idx = Some(i);
             break;
         }
@@ -601,11 +588,16 @@ fn list_remove(
 /// Implements Python's `list.clear()` method.
 ///
 /// Removes all items from the list.
+///
+/// The items are detached first, so the list is already empty (and its buffer released)
+/// while they're dropped. Lists without refs skip the per-item `drop_with_heap` entirely.
 fn list_clear(list: &mut List, heap: &mut Heap<impl ResourceTracker>) {
-    for item in list.items.drain(..) {
-        item.drop_with_heap(heap);
+    let items = std::mem::take(&mut list.items);
+    if list.contains_refs {
+        items.drop_with_heap(heap);
+        // an empty list holds no refs, so GC can skip it again
+        list.contains_refs = false;
     }
-    // Note: contains_refs stays true even if all refs removed, per conservative GC strategy
 }
 
 /// Implements Python's `list.copy()` method.
@@ -620,6 +612,10 @@ fn list_copy(list: &List, heap: &mut Heap<impl ResourceTracker>) -> Result<Value
 /// Implements Python's `list.extend(iterable)` method.
 ///
 /// Extends the list by appending all items from the iterable.
+///
+/// Lists and tuples are copied straight into the list's storage after a single reservation,
+/// other iterables are collected first (which pre-sizes using the iterator's length) and then
+/// moved in, again with one reservation.
 fn list_extend(
     list: &mut List,
     args: ArgValues,
@@ -627,13 +623,21 @@ fn list_extend(
     interns: &Interns,
 ) -> RunResult<Value> {
     let iterable = args.get_one_arg("list.extend", heap)?;
-    let items: SmallVec<[_; 2]> = MontyIter::new(iterable, heap, interns)?.collect(heap, interns)?;
 
-    // Add each item to the list
-    for item in items {
-        list.append(heap, item);
+    let prev_len = list.items.len();
+    if let Value::Ref(id) = &iterable
+        && heap.extend_from_sequence(*id, &mut list.items)
+    {
+        list.track_refs_since(prev_len, heap);
+        iterable.drop_with_heap(heap);
+        return Ok(Value::None);
     }
 
+    let items: SmallVec<[_; 2]> = MontyIter::new(iterable, heap, interns)?.collect(heap, interns)?;
+    list.items.reserve(items.len());
+    list.items.extend(items);
+    list.track_refs_since(prev_len, heap);
+
     Ok(Value::None)
 }
 
@@ -670,7 +674,7 @@ fn list_index(
     let mut guard = DepthGuard::default();
     for (i, item) in list.items[start..end].iter().enumerate() {
         heap.check_time()?;
-        if value.py_eq(item, heap, &mut guard, interns)? {
+        if eq_or_identical(value, item, heap, &mut guard, interns)? {
             let idx = i64::try_from(start + i).expect("index exceeds i64::MAX");
             return Ok(Value::Int(idx));
         }
@@ -695,7 +699,7 @@ fn list_count(
     let mut count: usize = 0;
     for item in &list.items {
         heap.check_time()?;
-        if value.py_eq(item, heap, &mut guard, interns)? {
+        if eq_or_identical(value, item, heap, &mut guard, interns)? {
             count += 1;
         }
     }
@@ -704,16 +708,48 @@ fn list_count(
     Ok(Value::Int(count_i64))
 }
 
+/// Resolves a Python-style item index (negative counts from the end) to a position in `[0, len)`.
+///
+/// Returns `None` if the index is out of bounds in either direction. A single unsigned
+/// comparison covers both directions, since a still-negative index fails the `usize` conversion.
+fn resolve_list_index(index: i64, len: usize) -> Option<usize> {
+    let len_i64 = i64::try_from(len).expect("list length exceeds i64::MAX");
+    // can't overflow: a negative index plus a non-negative length stays within i64
+    let normalized = if index < 0 { index + len_i64 } else { index };
+    usize::try_from(normalized).ok().filter(|&idx| idx < len)
+}
+
 /// Normalizes a Python-style list index to a valid index in range [0, len].
 fn normalize_list_index(index: i64, len: usize) -> usize {
     if index < 0 {
-        let abs_index = usize::try_from(-index).unwrap_or(usize::MAX);
+        // unsigned_abs rather than negation, which would overflow for i64::MIN
+        let abs_index = usize::try_from(index.unsigned_abs()).unwrap_or(usize::MAX);
         len.saturating_sub(abs_index)
     } else {
         usize::try_from(index).unwrap_or(len).min(len)
     }
 }
 
+/// Equality test used when searching a sequence for a value (`in`, `index`, `count`, `remove`).
+///
+/// Like CPython's `PyObject_RichCompareBool`, identity implies equality, so a value always
+/// matches itself: references to the same heap object match without descending into `py_eq`,
+/// and a float matches itself even when it's NaN (`[nan].count(nan) == 1`). Anything else
+/// falls through to `py_eq`.
+pub(crate) fn eq_or_identical(
+    value: &Value,
+    item: &Value,
+    heap: &mut Heap<impl ResourceTracker>,
+    guard: &mut DepthGuard,
+    interns: &Interns,
+) -> Result<bool, ResourceError> {
+    match (value, item) {
+        (Value::Ref(a), Value::Ref(b)) if a == b => Ok(true),
+        (Value::Float(a), Value::Float(b)) if a.to_bits() == b.to_bits() => Ok(true),
+        _ => value.py_eq(item, heap, guard, interns),
+    }
+}
+
 /// Performs an in-place sort on a list with optional key function and reverse flag.
 ///
 /// This is called from `call_list_attr_raw` when `list.sort()` is invoked.
@@ -760,6 +796,10 @@ fn do_list_sort(
         other => other,
     };
 
+    if key_fn.is_none() && sort_ints(list.as_vec_mut(), reverse) {
+        return Ok(());
+    }
+
     // Step 1: Extract items from the list (temporarily empties it)
     let mut items: Vec<Value> = list.as_vec_mut().drain(..).collect();
 
@@ -899,6 +939,36 @@ fn do_list_sort(
     Ok(())
 }
 
+/// Fast path for `list.sort()` without a key when every item is an `int` (as `Value::Int`).
+///
+/// Sorts the raw `i64`s directly instead of an index permutation compared through `py_cmp`,
+/// which avoids the per-comparison dispatch, time checks and error plumbing. Equal ints are
+/// indistinguishable, so an unstable sort gives the same result as Python's stable one.
+///
+/// Returns false, leaving `items` untouched, if any item isn't a `Value::Int`.
+fn sort_ints(items: &mut [Value], reverse: bool) -> bool {
+    let ints: Option<Vec<i64>> = items
+        .iter()
+        .map(|item| match item {
+            Value::Int(i) => Some(*i),
+            _ => None,
+        })
+        .collect();
+    let Some(mut ints) = ints else {
+        return false;
+    };
+
+    if reverse {
+        ints.sort_unstable_by(|a, b| b.cmp(a));
+    } else {
+        ints.sort_unstable();
+    }
+    for (item, i) in items.iter_mut().zip(ints) {
+        *item = Value::Int(i);
+    }
+    true
+}
+
 /// Calls a key function on a single element for sorting.
 ///
 /// Currently supports builtin functions directly. User-defined functions return
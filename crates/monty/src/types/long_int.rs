@@ -71,14 +71,24 @@ impl LongInt {
             i.hash(&mut hasher);
             hasher.finish()
         } else {
-            // For LongInts outside i64 range, use byte representation
-            let mut hasher = DefaultHasher::new();
-            // Use a unique discriminant for LongInt (we use the LongInt's sign and bytes)
-            let (sign, bytes) = self.0.to_bytes_le();
-            sign.hash(&mut hasher);
-            bytes.hash(&mut hasher);
-            hasher.finish()
+            Self::hash_big(&self.0)
+        }
+    }
+
+    /// Hashes a `BigInt` that doesn't fit in an i64 by its sign and 64-bit digits.
+    ///
+    /// Also used directly for interned long int literals (`Value::InternLongInt`), which are
+    /// always outside the i64 range, so the two produce identical hashes for equal values.
+    ///
+    /// Feeds the digits straight from the `BigInt`'s internal storage into the hasher rather than
+    /// serializing to a byte vector first (as `to_bytes_le()` would), so hashing never allocates.
+    pub fn hash_big(bi: &BigInt) -> u64 {
+        let mut hasher = DefaultHasher::new();
+        bi.sign().hash(&mut hasher);
+        for digit in bi.iter_u64_digits() {
+            digit.hash(&mut hasher);
         }
+        hasher.finish()
     }
 
     /// Estimates memory size in bytes.
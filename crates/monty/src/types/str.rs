@@ -134,6 +134,45 @@ pub fn allocate_char(c: char, heap: &mut Heap<impl ResourceTracker>) -> Result<V
     }
 }
 
+/// Splits a `str` value into its characters for `list(s)`, without going through `MontyIter`.
+///
+/// The generic iterator path copies the string before iterating it. Here heap strings are
+/// read in place, the result is allocated once at the exact character count, and ASCII
+/// strings map straight to the pre-interned single-character strings.
+///
+/// Returns `None` if `value` isn't a `str`.
+pub(crate) fn str_chars(
+    value: &Value,
+    heap: &mut Heap<impl ResourceTracker>,
+    interns: &Interns,
+) -> Option<Result<Vec<Value>, ResourceError>> {
+    match value {
+        Value::InternString(string_id) => Some(collect_chars(interns.get_str(*string_id), heap)),
+        Value::Ref(id) => heap.with_entry_mut(*id, |heap, data| match data {
+            HeapData::Str(s) => Some(collect_chars(s.as_str(), heap)),
+            _ => None,
+        }),
+        _ => None,
+    }
+}
+
+/// Allocates one single-character string value per character of `s`.
+fn collect_chars(s: &str, heap: &mut Heap<impl ResourceTracker>) -> Result<Vec<Value>, ResourceError> {
+    if s.is_ascii() {
+        return Ok(s
+            .bytes()
+            .map(|b| Value::InternString(StringId::from_ascii(b)))
+            .collect());
+    }
+
+    let mut chars_guard = HeapGuard::new(Vec::with_capacity(s.chars().count()), heap);
+    let (chars, heap) = chars_guard.as_parts_mut();
+    for c in s.chars() {
+        chars.push(allocate_char(c, heap)?);
+    }
+    Ok(chars_guard.into_inner())
+}
+
 /// Gets the character at a given index in a string, handling negative indices.
 ///
 /// Returns `None` if the index is out of bounds. This uses a single-pass scan
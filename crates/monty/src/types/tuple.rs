@@ -28,7 +28,7 @@ pub(crate) type TupleVec = SmallVec<[Value; TUPLE_INLINE_CAPACITY]>;
 
 use super::{
     MontyIter, PyTrait,
-    list::{get_slice_items, repr_sequence_fmt},
+    list::{eq_or_identical, get_slice_items, repr_sequence_fmt},
 };
 use crate::{
     args::ArgValues,
@@ -320,7 +320,7 @@ fn tuple_index(
     let mut guard = DepthGuard::default();
     // Search for the value in the specified range
     for (i, item) in tuple.as_slice()[start..end].iter().enumerate() {
-        if value.py_eq(item, heap, &mut guard, interns)? {
+        if eq_or_identical(value, item, heap, &mut guard, interns)? {
             let idx = i64::try_from(start + i).expect("index exceeds i64::MAX");
             return Ok(Value::Int(idx));
         }
@@ -344,7 +344,7 @@ fn tuple_count(
     let mut guard = DepthGuard::default();
     let mut count = 0usize;
     for item in tuple.as_slice() {
-        if value.py_eq(item, heap, &mut guard, interns)? {
+        if eq_or_identical(value, item, heap, &mut guard, interns)? {
             count += 1;
         }
     }
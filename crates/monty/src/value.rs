@@ -27,6 +27,7 @@ use crate::{
     types::{
         AttrCallResult, LongInt, Property, PyTrait, Str, Type,
         bytes::{bytes_repr_fmt, get_byte_at_index, get_bytes_slice},
+        list::eq_or_identical,
         path,
         str::{allocate_char, get_char_at_index, get_str_slice, string_repr_fmt},
     },
@@ -414,6 +415,25 @@ impl PyTrait for Value {
         }
     }
 
+    fn py_repr(
+        &self,
+        heap: &Heap<impl ResourceTracker>,
+        guard: &mut DepthGuard,
+        interns: &Interns,
+    ) -> Cow<'static, str> {
+        // Empty containers have a fixed repr, skip formatting them into a new String
+        if let Self::Ref(id) = self
+            && let Some(repr) = heap.get(*id).empty_repr()
+        {
+            return Cow::Borrowed(repr);
+        }
+        let mut s = String::new();
+        let mut heap_ids = AHashSet::new();
+        // Unwrap is safe: writing to String never fails
+        self.py_repr_fmt(&mut s, heap, &mut heap_ids, guard, interns).unwrap();
+        Cow::Owned(s)
+    }
+
     fn py_str(
         &self,
         heap: &Heap<impl ResourceTracker>,
@@ -1581,14 +1601,9 @@ impl Value {
                 interns.get_bytes(*bytes_id).hash(&mut hasher);
                 return Some(hasher.finish());
             }
-            // Hash BigInt consistently with LongInt (using sign and bytes for large values)
+            // Hash BigInt consistently with LongInt (interned long ints never fit in i64)
             Self::InternLongInt(long_int_id) => {
-                let bi = interns.get_long_int(*long_int_id);
-                let mut hasher = DefaultHasher::new();
-                let (sign, bytes) = bi.to_bytes_le();
-                sign.hash(&mut hasher);
-                bytes.hash(&mut hasher);
-                return Some(hasher.finish());
+                return Some(LongInt::hash_big(interns.get_long_int(*long_int_id)));
             }
             // For heap-allocated values (includes Range and Exception), compute hash lazily and cache it
             Self::Ref(id) => return heap.get_or_compute_hash(*id, interns),
@@ -1648,7 +1663,7 @@ impl Value {
                     HeapData::List(list) => {
                         let mut guard = DepthGuard::default();
                         for el in list.as_slice() {
-                            if item.py_eq(el, heap, &mut guard, interns)? {
+                            if eq_or_identical(item, el, heap, &mut guard, interns)? {
                                 return Ok(true);
                             }
                         }
@@ -1657,7 +1672,7 @@ impl Value {
                     HeapData::Tuple(tuple) => {
                         let mut guard = DepthGuard::default();
                         for el in tuple.as_slice() {
-                            if item.py_eq(el, heap, &mut guard, interns)? {
+                            if eq_or_identical(item, el, heap, &mut guard, interns)? {
                                 return Ok(true);
                             }
                         }
@@ -94,6 +94,9 @@ assert h1 == h2, 'same bigint literal has same hash'
 # Computed equal value should have same hash
 h3 = hash(10**40)
 assert h1 == h3, 'bigint literal hash equals computed hash'
+assert hash(-(10**40)) == hash(-10000000000000000000000000000000000000000), 'negative bigint hash consistent'
+assert hash(10**40) != hash(-(10**40)), 'bigint sign affects hash'
+assert {10**40: 'a'}[10000000000000000000000000000000000000000] == 'a', 'bigint literal finds computed dict key'
 
 # === BigInt literal bitwise operations ===
 assert 10000000000000000000000000000000000000000 & 0xFF == (10**40) & 0xFF, 'bigint literal & int'
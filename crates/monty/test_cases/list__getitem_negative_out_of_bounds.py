@@ -0,0 +1,3 @@
+a = [1, 2, 3]
+a[-4]
+# Raise=IndexError('list index out of range')
@@ -24,6 +24,16 @@ lst = [1, 2]
 lst += lst
 assert lst == [1, 2, 1, 2], 'iadd self'
 
+inner = [0]
+lst = [inner, 'a']
+lst += lst
+assert lst == [[0], 'a', [0], 'a'], 'iadd self with refs'
+assert lst[2] is inner, 'iadd self shares items'
+
+lst = []
+lst += lst
+assert lst == [], 'iadd self empty'
+
 # === List length ===
 assert len([]) == 0, 'len empty'
 assert len([1, 2, 3]) == 3, 'len basic'
@@ -45,6 +55,10 @@ assert a[-2] == 2, 'getitem -2'
 # === List repr/str ===
 assert repr([]) == '[]', 'empty list repr'
 assert str([]) == '[]', 'empty list str'
+assert repr(()) == '()' and str(()) == '()', 'empty tuple repr and str'
+assert repr({}) == '{}' and str({}) == '{}', 'empty dict repr and str'
+assert repr([[], (), {}]) == '[[], (), {}]', 'nested empty containers repr'
+assert f'{[]}' == '[]', 'empty list in f-string'
 
 assert repr([1, 2, 3]) == '[1, 2, 3]', 'list repr'
 assert str([1, 2, 3]) == '[1, 2, 3]', 'list str'
@@ -57,6 +71,12 @@ assert [1] * -1 == [], 'list mult negative'
 assert [] * 5 == [], 'empty list mult'
 assert [1, 2] * 1 == [1, 2], 'list mult one'
 assert [[1]] * 2 == [[1], [1]], 'nested list mult'
+inner = [1]
+rep = [inner, 'a'] * 3
+assert rep == [[1], 'a', [1], 'a', [1], 'a'], 'list of refs mult'
+assert rep[0] is inner and rep[4] is inner, 'list mult repeats references, not copies'
+inner.append(2)
+assert rep[2] == [1, 2], 'list mult items are shared'
 
 # === List repetition augmented assignment (*=) ===
 lst = [1, 2]
@@ -75,11 +95,20 @@ assert list(range(3)) == [0, 1, 2], 'list from range'
 assert list('abc') == ['a', 'b', 'c'], 'list from string'
 assert list(b'abc') == [97, 98, 99], 'list from bytes'
 assert list({'a': 1, 'b': 2}) == ['a', 'b'], 'list from dict yields keys'
+assert list({}) == [], 'list from empty dict'
+key = (1, 'x' * 2)
+lst = list({key: 1, 3: 2})
+assert lst == [(1, 'xx'), 3], 'list from dict with heap keys'
+assert lst[0] is key, 'list from dict shares keys'
 
 # non-ASCII strings (multi-byte UTF-8)
 assert list('héllo') == ['h', 'é', 'l', 'l', 'o'], 'list from string with accented char'
 assert list('日本') == ['日', '本'], 'list from string with CJK chars'
 assert list('a🎉b') == ['a', '🎉', 'b'], 'list from string with emoji'
+s = 'x' * 3 + 'é'
+assert list(s) == ['x', 'x', 'x', 'é'], 'list from heap string'
+assert s == 'xxxé', 'list leaves source string unchanged'
+assert list('') == [], 'list from empty string'
 
 # === list.append() ===
 lst = []
@@ -122,6 +151,11 @@ lst = [1, 2, 3]
 lst.insert(-100, 'a')
 assert lst == ['a', 1, 2, 3], 'insert very negative clamps to 0'
 
+lst = [1, 2, 3]
+lst.insert(-9223372036854775808, 'a')
+assert lst == ['a', 1, 2, 3], 'insert at i64 min clamps to 0'
+assert lst.index(1, -9223372036854775808) == 1, 'index with i64 min start'
+
 # === list.pop() ===
 lst = [1, 2, 3]
 assert lst.pop() == 3, 'pop without argument returns last'
@@ -143,6 +177,12 @@ lst = [1, 2, 3]
 assert lst.pop(-2) == 2, 'pop(-2) returns second to last'
 assert lst == [1, 3], 'pop(-2) removes second to last element'
 
+lst = [[1], 2, 'c']
+popped = []
+while lst:
+    popped.append(lst.pop())
+assert popped == ['c', 2, [1]], 'pop drains list from the end'
+
 # === list.remove() ===
 lst = [1, 2, 3, 2]
 lst.remove(2)
@@ -161,6 +201,14 @@ lst = []
 lst.clear()
 assert lst == [], 'clear on empty list is no-op'
 
+inner = [1]
+lst = [inner, 'a', inner]
+lst.clear()
+assert lst == [], 'clear list of refs'
+assert inner == [1], 'clear leaves cleared items intact'
+lst.append(inner)
+assert lst[0] is inner, 'append after clear'
+
 # === list.copy() ===
 lst = [1, 2, 3]
 copy = lst.copy()
@@ -190,6 +238,21 @@ lst = []
 lst.extend([])
 assert lst == [], 'extend empty with empty'
 
+src = [[1], 'x']
+lst = [0]
+lst.extend(src)
+assert lst == [0, [1], 'x'], 'extend with list of refs'
+assert src == [[1], 'x'], 'extend leaves source list unchanged'
+assert lst[1] is src[0], 'extend shares items with source'
+
+lst = []
+lst.extend(([1], [2]))
+assert lst == [[1], [2]], 'extend with tuple of refs'
+
+lst = [1]
+lst.extend({'a': 1, 'b': 2})
+assert lst == [1, 'a', 'b'], 'extend with dict yields keys'
+
 # === list.index() ===
 lst = [1, 2, 3, 2]
 assert lst.index(2) == 1, 'index finds first occurrence'
@@ -204,6 +267,17 @@ assert lst.count(1) == 1, 'count single occurrence'
 assert lst.count(4) == 0, 'count zero occurrences'
 assert [].count(1) == 0, 'count on empty list'
 
+# identity implies equality when searching, like CPython
+nan = float('nan')
+lst = [1, nan, nan]
+assert lst.count(nan) == 2, 'count matches nan by identity'
+assert lst.index(nan) == 1, 'index matches nan by identity'
+assert nan in lst, 'in matches nan by identity'
+lst.remove(nan)
+assert len(lst) == 2, 'remove matches nan by identity'
+assert (nan,).count(nan) == 1, 'tuple count matches nan by identity'
+assert (1, nan).index(nan) == 1, 'tuple index matches nan by identity'
+
 # === list.reverse() ===
 lst = [1, 2, 3]
 lst.reverse()
@@ -238,6 +312,16 @@ lst = [1]
 lst.sort()
 assert lst == [1], 'sort single element'
 
+lst = [5, -3, 9223372036854775807, 0, -9223372036854775808, 5]
+lst.sort()
+assert lst == [-9223372036854775808, -3, 0, 5, 5, 9223372036854775807], 'sort ints across i64 range'
+lst.sort(reverse=True)
+assert lst == [9223372036854775807, 5, 5, 0, -3, -9223372036854775808], 'sort ints across i64 range reverse'
+
+lst = [3, True, 2.5, 0]
+lst.sort()
+assert lst == [0, True, 2.5, 3], 'sort mixed numeric types'
+
 # === list.sort(key=...) ===
 lst = ['banana', 'apple', 'cherry']
 lst.sort(key=len)
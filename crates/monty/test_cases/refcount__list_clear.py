@@ -0,0 +1,5 @@
+inner = [1]
+outer = [inner, inner]
+outer.clear()
+outer
+# ref-counts={'inner': 1, 'outer': 2}
@@ -0,0 +1,5 @@
+inner = [1]
+a = [inner]
+a += a
+a
+# ref-counts={'inner': 3, 'a': 2}
@@ -0,0 +1,4 @@
+inner = [1]
+outer = [inner] * 3
+outer
+# ref-counts={'inner': 4, 'outer': 2}